@@ -4,8 +4,13 @@ Sets up paths and fixtures for testing.
 """
 
 import sys
+import functools
 from pathlib import Path
 
+import numpy as np
+import pytest
+from scipy.stats import norm
+
 # Add project root to Python path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
@@ -13,3 +18,87 @@ sys.path.insert(0, str(project_root))
 # Also add subdirectories
 for subdir in ['options', 'portfolio', 'factors', 'utils']:
     sys.path.insert(0, str(project_root / subdir))
+
+from options.black_scholes import black_scholes_call
+from options.greeks import delta_call, gamma, vega, theta_call, rho_call
+from factors.data_loader import generate_synthetic_factors
+
+
+# Seed for synthetic factor panels; kept apart from the seed tests use for
+# stock-specific noise so the two streams are not identical draws
+FACTOR_SEED = 12345
+
+# At-the-money reference contract shared across option tests: (S0, K, r, sigma, T)
+ATM_OPTION = (100.0, 100.0, 0.05, 0.20, 1.0)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warmup():
+    """
+    Touch LAPACK and scipy.stats once so the first test that uses them
+    does not absorb the one-time library load and dispatch cost.
+    """
+    np.linalg.cholesky(np.eye(4))
+    norm.cdf(0.0)
+
+
+@pytest.fixture(scope="session")
+def rng():
+    """
+    Session-wide NumPy Generator (PCG64) seeded with 42.
+    
+    Shared across tests, so its draws depend on test order; use rng.spawn()
+    for per-worker generators.
+    """
+    return np.random.default_rng(42)
+
+
+@functools.lru_cache(maxsize=128)
+def _bs(S0, K, r, sigma, T):
+    """Memoized Black-Scholes call price."""
+    return black_scholes_call(S0, K, r, sigma, T)
+
+
+@functools.lru_cache(maxsize=128)
+def _bs_greeks(S0, K, r, sigma, T):
+    """Memoized Black-Scholes call Greeks."""
+    return {
+        'delta': delta_call(S0, K, T, r, sigma),
+        'gamma': gamma(S0, K, T, r, sigma),
+        'vega': vega(S0, K, T, r, sigma),
+        'theta': theta_call(S0, K, T, r, sigma),
+        'rho': rho_call(S0, K, T, r, sigma)
+    }
+
+
+@pytest.fixture(scope="session")
+def bs_price():
+    """Black-Scholes price of the ATM reference call."""
+    return _bs(*ATM_OPTION)
+
+
+@pytest.fixture(scope="session")
+def bs_greeks():
+    """Greeks of the ATM reference call."""
+    return _bs_greeks(*ATM_OPTION)
+
+
+@pytest.fixture(scope="session")
+def ff3_daily_1y():
+    """One year of synthetic daily FF3 factors."""
+    return generate_synthetic_factors(model='3', frequency='daily', years=1,
+                                      rng=np.random.default_rng(FACTOR_SEED))
+
+
+@pytest.fixture(scope="session")
+def ff3_daily_3y():
+    """Three years of synthetic daily FF3 factors."""
+    return generate_synthetic_factors(model='3', frequency='daily', years=3,
+                                      rng=np.random.default_rng(FACTOR_SEED))
+
+
+@pytest.fixture(scope="session")
+def ff5_daily_3y():
+    """Three years of synthetic daily FF5 factors."""
+    return generate_synthetic_factors(model='5', frequency='daily', years=3,
+                                      rng=np.random.default_rng(FACTOR_SEED))
@@ -96,12 +96,22 @@ def fetch_ff_factors(model='3', frequency='daily'):
         return generate_synthetic_factors(model, frequency)
 
 
-def generate_synthetic_factors(model='3', frequency='daily', years=5):
+def generate_synthetic_factors(model='3', frequency='daily', years=5, rng=None):
     """
     Generate synthetic factor data for testing.
     Based on historical factor characteristics.
+    
+    Parameters:
+    -----------
+    rng : np.random.Generator, optional
+        Random generator to draw from. If None, the global NumPy state is
+        reseeded with 42 for reproducibility.
     """
-    np.random.seed(42)
+    if rng is None:
+        np.random.seed(42)
+        standard_normal = np.random.standard_normal
+    else:
+        standard_normal = rng.standard_normal
     
     if frequency == 'daily':
         periods = years * 252
@@ -117,18 +127,28 @@ def generate_synthetic_factors(model='3', frequency='daily', years=5):
     else:
         scale = 1/12
     
-    data = {
-        'Mkt-RF': np.random.normal(0.08 * scale, 0.16 * np.sqrt(scale), periods),
-        'SMB': np.random.normal(0.02 * scale, 0.10 * np.sqrt(scale), periods),
-        'HML': np.random.normal(0.03 * scale, 0.10 * np.sqrt(scale), periods),
-        'RF': np.ones(periods) * 0.02 * scale  # Risk-free rate
-    }
-    
+    factors = ['Mkt-RF', 'SMB', 'HML']
+    mu = [0.08, 0.02, 0.03]
+    sigma = [0.16, 0.10, 0.10]
     if model == '5':
-        data['RMW'] = np.random.normal(0.03 * scale, 0.08 * np.sqrt(scale), periods)
-        data['CMA'] = np.random.normal(0.03 * scale, 0.08 * np.sqrt(scale), periods)
+        factors += ['RMW', 'CMA']
+        mu += [0.03, 0.03]
+        sigma += [0.08, 0.08]
+    
+    # Factors are independent, so the covariance Cholesky factor is diagonal
+    # and the whole panel is one draw plus a broadcast scale/shift. Drawing
+    # factor-major keeps the same random stream as per-column sampling.
+    z = standard_normal((len(factors), periods))
+    draws = (np.array(mu)[:, None] * scale
+             + np.array(sigma)[:, None] * np.sqrt(scale) * z)
+    
+    columns = factors[:3] + ['RF'] + factors[3:]
+    values = np.empty((periods, len(columns)))
+    values[:, :3] = draws[:3].T
+    values[:, 3] = 0.02 * scale  # Risk-free rate
+    values[:, 4:] = draws[3:].T
     
-    return pd.DataFrame(data, index=dates)
+    return pd.DataFrame(values, index=dates, columns=columns, copy=False)
 
 
 def fetch_stock_returns(ticker, start_date=None, end_date=None, period='5y'):
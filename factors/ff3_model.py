@@ -6,6 +6,7 @@ R_i - R_f = α + β_mkt(R_m - R_f) + β_smb(SMB) + β_hml(HML) + ε
 import numpy as np
 import pandas as pd
 import statsmodels.api as sm
+from scipy.linalg import lstsq
 from factors.data_loader import fetch_ff_factors, fetch_stock_returns, align_data
 
 
@@ -25,9 +26,44 @@ class FF3Model:
         self.alpha = None
         self.betas = None
         self.r_squared = None
+        self.alphas = None
+        self.betas_matrix = None
+        self.residuals = None
+        self.sigma2 = None
         self.factor_names = ['Mkt-RF', 'SMB', 'HML']
     
-    def fit(self, excess_returns, factor_data):
+    def build_design(self, factor_data):
+        """
+        Build the OLS design matrix (constant + Mkt-RF, SMB, HML).
+        
+        Build it once and pass it as `design` to fit()/predict() when
+        regressing several stocks on the same factor panel.
+        
+        Parameters:
+        -----------
+        factor_data : pd.DataFrame
+            Factor returns (must contain Mkt-RF, SMB, HML)
+        
+        Returns:
+        --------
+        pd.DataFrame
+        """
+        return sm.add_constant(factor_data[self.factor_names])
+    
+    @staticmethod
+    def _lstsq(X, Y):
+        """
+        Least-squares coefficients of Y on the design X (no inference).
+        
+        Shared by fit_fast() and fit_batch(); Y may hold one stock or one
+        column per stock.
+        """
+        X = np.asarray(X, dtype=float)
+        Y = np.asarray(Y, dtype=float)
+        coefs, _, _, _ = lstsq(X, Y, lapack_driver='gelsy', check_finite=False)
+        return X, Y, coefs
+    
+    def fit(self, excess_returns, factor_data=None, design=None):
         """
         Fit the 3-factor model using OLS regression.
         
@@ -37,18 +73,16 @@ class FF3Model:
             Stock excess returns (R_i - R_f)
         factor_data : pd.DataFrame
             Factor returns (must contain Mkt-RF, SMB, HML)
+        design : pd.DataFrame, optional
+            Precomputed design matrix from build_design(); replaces factor_data
         
         Returns:
         --------
         self
         """
-        # Extract factors
-        X = factor_data[self.factor_names]
+        X = design if design is not None else self.build_design(factor_data)
         y = excess_returns
         
-        # Add constant for alpha
-        X = sm.add_constant(X)
-        
         # Force exactly matching indices to prevent any alignment conflicts during fitting
         y.index = X.index
         
@@ -67,6 +101,73 @@ class FF3Model:
         
         return self
     
+    def fit_fast(self, excess_returns, factor_data=None, design=None):
+        """
+        Fit the 3-factor model with a bare least-squares solve.
+        
+        Sets alpha, betas, residuals and the residual variance sigma2 but
+        skips statsmodels' inference, so summary() is unavailable (results
+        from an earlier fit() are cleared); use fit() for t-stats and p-values.
+        
+        Parameters:
+        -----------
+        excess_returns : pd.Series or np.ndarray
+            Stock excess returns (R_i - R_f)
+        factor_data : pd.DataFrame
+            Factor returns (must contain Mkt-RF, SMB, HML)
+        design : pd.DataFrame, optional
+            Precomputed design matrix from build_design(); replaces factor_data
+        
+        Returns:
+        --------
+        self
+        """
+        X = design if design is not None else self.build_design(factor_data)
+        X, y, coefs = self._lstsq(X, excess_returns)
+        
+        # Nothing from an earlier fit() may describe this one
+        self.model = None
+        self.results = None
+        self.r_squared = None
+        self.alpha = coefs[0]
+        self.betas = dict(zip(self.factor_names, coefs[1:]))
+        self.residuals = y - X @ coefs
+        self.sigma2 = self.residuals @ self.residuals / (len(y) - X.shape[1])
+        
+        return self
+    
+    def fit_batch(self, excess_returns_matrix, factor_data=None, design=None):
+        """
+        Fit the 3-factor model for several stocks with one least-squares solve.
+        
+        Only point estimates are produced; use fit() for t-stats and p-values.
+        
+        Parameters:
+        -----------
+        excess_returns_matrix : np.ndarray or pd.DataFrame
+            Stock excess returns, one column per stock (n_obs x n_stocks)
+        factor_data : pd.DataFrame
+            Factor returns (must contain Mkt-RF, SMB, HML)
+        design : pd.DataFrame, optional
+            Precomputed design matrix from build_design(); replaces factor_data
+        
+        Returns:
+        --------
+        self
+        """
+        X = design if design is not None else self.build_design(factor_data)
+        
+        Y = np.asarray(excess_returns_matrix, dtype=float)
+        if Y.ndim == 1:
+            Y = Y[:, np.newaxis]
+        
+        _, _, coefs = self._lstsq(X, Y)
+        
+        self.alphas = coefs[0]
+        self.betas_matrix = coefs[1:].T  # (n_stocks, n_factors)
+        
+        return self
+    
     def summary(self, annualize=True):
         """
         Return model summary statistics.
@@ -96,17 +197,20 @@ class FF3Model:
         
         return summary
     
-    def predict(self, factor_data):
+    def predict(self, factor_data=None, design=None):
         """
         Predict expected excess returns given factor values.
+        
+        Works after fit() or fit_fast(): uses alpha and betas, which both set.
         """
-        if self.results is None:
+        if self.alpha is None:
             raise ValueError("Model not fitted. Call fit() first.")
         
-        X = factor_data[self.factor_names]
-        X = sm.add_constant(X)
+        X = design if design is not None else self.build_design(factor_data)
+        params = np.array([self.alpha] + [self.betas[f] for f in self.factor_names])
         
-        return self.results.predict(X)
+        # Designs passed to fit_fast() may be plain ndarrays without an index
+        return pd.Series(np.asarray(X) @ params, index=getattr(X, 'index', None))
     
     def print_summary(self, ticker='Stock'):
         """
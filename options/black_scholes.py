@@ -2,6 +2,7 @@
 Black-Scholes analytical formulas for comparison.
 """
 import numpy as np
+from scipy.special import ndtr
 from scipy.stats import norm
 
 
@@ -16,6 +17,22 @@ def black_scholes_call(S0, K, r, sigma, T):
     return call
 
 
+def black_scholes_call_vec(S0, K, r, sigma, T):
+    """
+    Vectorized Black-Scholes call price over arrays of inputs.
+    
+    Accepts scalars or broadcastable arrays and prices the whole batch in
+    one pass, using scipy.special.ndtr for the normal CDF.
+    """
+    S0, K, r, sigma, T = (np.asarray(x, dtype=np.float64) for x in (S0, K, r, sigma, T))
+    
+    sqrt_T = np.sqrt(T)
+    d1 = (np.log(S0 / K) + (r + 0.5 * sigma**2) * T) / (sigma * sqrt_T)
+    d2 = d1 - sigma * sqrt_T
+    
+    return S0 * ndtr(d1) - K * np.exp(-r * T) * ndtr(d2)
+
+
 def black_scholes_put(S0, K, r, sigma, T):
     """
     Analytical Black-Scholes price for European put option.
@@ -55,6 +55,23 @@ def price_european_put(S0, K, r, sigma, T, n_paths=10000, n_steps=252):
     return price
 
 
+def payoff_call_inplace(S_range, K, price, out):
+    """
+    Long-call profit/loss max(S - K, 0) - price, written into `out`.
+    
+    Avoids temporaries when the payoff diagram is recomputed on a fixed
+    spot grid. `out` must be a float array with the shape of `S_range`.
+    
+    Returns:
+    --------
+    np.ndarray: `out`
+    """
+    np.subtract(S_range, K, out=out)
+    np.maximum(out, 0, out=out)
+    np.subtract(out, price, out=out)
+    return out
+
+
 if __name__ == "__main__":
     # Parameters
     S0 = 100      # Stock price
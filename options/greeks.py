@@ -120,6 +120,40 @@ def volga(S, K, T, r, sigma):
     return v * d1_val * d2_val / sigma
 
 
+# =============================================================================
+# Batched Greeks
+# =============================================================================
+
+def greeks_batch(S, K, T, r, sigma):
+    """
+    All first-order call Greeks plus gamma in one pass.
+    
+    d1, d2, n(d1), N(d1) and N(d2) are computed once and shared, instead of
+    once per Greek. Accepts scalars or broadcastable arrays.
+    
+    Returns:
+    --------
+    tuple : (delta, gamma, vega, theta, rho), in the same units as
+            delta_call, gamma, vega, theta_call and rho_call
+    """
+    sqrt_T = np.sqrt(T)
+    d1_val = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * sqrt_T)
+    d2_val = d1_val - sigma * sqrt_T
+    
+    nd1 = norm.pdf(d1_val)
+    Nd1 = norm.cdf(d1_val)
+    Nd2 = norm.cdf(d2_val)
+    K_disc = K * np.exp(-r * T)
+    
+    delta = Nd1
+    gamma_val = nd1 / (S * sigma * sqrt_T)
+    vega_val = S * nd1 * sqrt_T / 100
+    theta = (-S * nd1 * sigma / (2 * sqrt_T) - r * K_disc * Nd2) / 365
+    rho = K_disc * T * Nd2 / 100
+    
+    return delta, gamma_val, vega_val, theta, rho
+
+
 if __name__ == "__main__":
     # Example: ATM option
     S = 100      # Spot price
@@ -0,0 +1,87 @@
+"""
+Numba JIT kernels for European options: Monte Carlo pricing and Greeks.
+Optional: requires numba, which is not part of the base requirements.
+"""
+
+import math
+
+import numba
+import numpy as np
+
+
+SQRT2 = math.sqrt(2.0)
+SQRT_2PI = math.sqrt(2.0 * math.pi)
+
+
+@numba.njit(parallel=True, fastmath=True, cache=True)
+def mc_call(S0, K, r, sigma, T, n_paths):
+    """
+    Price a European call by Monte Carlo, one terminal draw per path.
+    
+    Paths are split across threads with prange and reduced into a single
+    accumulator, so no path array is ever materialized.
+    
+    Numba's parallel threading layer is not fork-safe: once this kernel has
+    run, do not fork the process (e.g. monte_carlo_parallel's default
+    ProcessPoolExecutor on Linux), or the children and the interpreter
+    shutdown can deadlock.
+    
+    Parameters:
+    -----------
+    S0 : float
+        Current stock price
+    K : float
+        Strike price
+    r : float
+        Risk-free rate (annualized)
+    sigma : float
+        Volatility (annualized)
+    T : float
+        Time to maturity (years)
+    n_paths : int
+        Number of simulation paths
+    
+    Returns:
+    --------
+    float : Option price
+    """
+    drift = (r - 0.5 * sigma * sigma) * T
+    vol = sigma * math.sqrt(T)
+    
+    acc = 0.0
+    for i in numba.prange(n_paths):
+        z = np.random.standard_normal()
+        ST = S0 * math.exp(drift + vol * z)
+        acc += max(ST - K, 0.0)
+    
+    return math.exp(-r * T) * acc / n_paths
+
+
+@numba.njit(fastmath=True, cache=True)
+def greeks_call(S, K, T, r, sigma):
+    """
+    Call delta, gamma, vega, theta and rho for one contract.
+    
+    Scalar JIT counterpart of greeks.greeks_batch, with the same units
+    (vega and rho per 1%, theta per day).
+    
+    Returns:
+    --------
+    tuple : (delta, gamma, vega, theta, rho)
+    """
+    sqrt_T = math.sqrt(T)
+    d1 = (math.log(S / K) + (r + 0.5 * sigma * sigma) * T) / (sigma * sqrt_T)
+    d2 = d1 - sigma * sqrt_T
+    
+    Nd1 = 0.5 * (1.0 + math.erf(d1 / SQRT2))
+    Nd2 = 0.5 * (1.0 + math.erf(d2 / SQRT2))
+    nd1 = math.exp(-0.5 * d1 * d1) / SQRT_2PI
+    K_disc = K * math.exp(-r * T)
+    
+    delta = Nd1
+    gamma = nd1 / (S * sigma * sqrt_T)
+    vega = S * nd1 * sqrt_T / 100.0
+    theta = (-S * nd1 * sigma / (2.0 * sqrt_T) - r * K_disc * Nd2) / 365.0
+    rho = K_disc * T * Nd2 / 100.0
+    
+    return delta, gamma, vega, theta, rho
@@ -4,8 +4,8 @@ Uses multiprocessing for significant speedup on multi-core systems.
 """
 
 import numpy as np
-from multiprocessing import Pool, cpu_count
-from functools import partial
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import cpu_count
 import sys
 from pathlib import Path
 
@@ -18,48 +18,116 @@ from utils.validation import validate_option_params, validate_monte_carlo_params
 logger = get_default_logger(__name__)
 
 
-def _simulate_batch(batch_size: int, S0: float, r: float, sigma: float, T: float, K: float, option_type: str, seed: int = None) -> tuple:
+# Paths simulated per inner block: the two work buffers (2 MB each at float64)
+# stay cache-resident and peak memory does not grow with n_paths
+CHUNK = 262_144
+
+
+def _mc_chunk(args: tuple) -> tuple:
     """
-    Simulate a batch of option prices (worker function for parallel processing).
+    Simulate one chunk of option payoffs (worker function for parallel processing).
+    
+    Defined at module level so it can be pickled by ProcessPoolExecutor.
+    Paths are generated in blocks of CHUNK into preallocated buffers of the
+    requested dtype; the payoff sums are always accumulated in float64.
     
     Parameters:
     -----------
-    batch_size : int
-        Number of paths in this batch
-    S0, r, sigma, T, K : float
-        Option parameters
-    option_type : str
-        'call' or 'put'
-    seed : int, optional
-        Random seed for reproducibility
+    args : tuple
+        (S0, K, r, sigma, T, n_paths, option_type, seed, dtype) where seed is
+        a np.random.SeedSequence (or int) for this chunk's generator and
+        dtype is np.float32 or np.float64
     
     Returns:
     --------
     tuple : (sum of payoffs, sum of squared payoffs, count)
     """
-    if seed is not None:
-        np.random.seed(seed)
+    S0, K, r, sigma, T, n_paths, option_type, seed, dtype = args
+    rng = np.random.default_rng(seed)
     
-    # Simulate terminal prices
-    Z = np.random.standard_normal(batch_size)
-    ST = S0 * np.exp((r - 0.5 * sigma**2) * T + sigma * np.sqrt(T) * Z)
+    drift = (r - 0.5 * sigma**2) * T
+    vol = sigma * np.sqrt(T)
+    discount = np.exp(-r * T)
     
-    # Calculate payoffs
-    if option_type == 'call':
-        payoffs = np.maximum(ST - K, 0)
-    else:  # put
-        payoffs = np.maximum(K - ST, 0)
+    size = min(CHUNK, n_paths)
+    z_buf = np.empty(size, dtype=dtype)
+    payoff_buf = np.empty(size, dtype=dtype)
     
-    # Discount to present value
-    discounted_payoffs = np.exp(-r * T) * payoffs
+    total = 0.0
+    total_sq = 0.0
+    remaining = n_paths
+    while remaining > 0:
+        m = min(size, remaining)
+        z, payoff = z_buf[:m], payoff_buf[:m]
+        
+        # Simulate terminal prices in place
+        rng.standard_normal(dtype=dtype, out=z)
+        np.multiply(z, vol, out=z)
+        np.add(z, drift, out=z)
+        np.exp(z, out=z)
+        np.multiply(z, S0, out=z)
+        
+        # Calculate payoffs
+        if option_type == 'call':
+            np.subtract(z, K, out=payoff)
+        else:  # put
+            np.subtract(K, z, out=payoff)
+        np.maximum(payoff, 0, out=payoff)
+        
+        total += payoff.sum(dtype=np.float64)
+        # z is no longer needed: reuse it for the squared payoffs
+        np.multiply(payoff, payoff, out=z)
+        total_sq += z.sum(dtype=np.float64)
+        remaining -= m
     
+    # Discount to present value
     return (
-        np.sum(discounted_payoffs),
-        np.sum(discounted_payoffs ** 2),
-        batch_size
+        discount * total,
+        discount**2 * total_sq,
+        n_paths
     )
 
 
+def _price_parallel(S0, K, r, sigma, T, n_paths, n_workers, option_type, seed,
+                    dtype=np.float64) -> tuple:
+    """
+    Split the simulation into one chunk per worker, run the chunks in a
+    process pool and aggregate them into (price, standard_error).
+    """
+    # Determine number of workers
+    if n_workers is None:
+        n_workers = min(cpu_count(), 8)  # Cap at 8 to avoid overhead
+    
+    # Split work into chunks
+    chunk_size = n_paths // n_workers
+    chunks = [chunk_size] * n_workers
+    # Handle remainder
+    chunks[-1] += n_paths - sum(chunks)
+    
+    # Independent random streams for each chunk
+    seeds = np.random.SeedSequence(seed).spawn(n_workers)
+    tasks = [
+        (S0, K, r, sigma, T, n, option_type, chunk_seed, dtype)
+        for n, chunk_seed in zip(chunks, seeds)
+    ]
+    
+    # Run parallel simulation
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        results = list(executor.map(_mc_chunk, tasks))
+    
+    # Aggregate results
+    total_sum = sum(res[0] for res in results)
+    total_sum_sq = sum(res[1] for res in results)
+    total_count = sum(res[2] for res in results)
+    
+    # Calculate price and standard error
+    price = total_sum / total_count
+    variance = (total_sum_sq / total_count) - (price ** 2)
+    std_error = np.sqrt(variance / total_count)
+    
+    return price, std_error
+
+
 def price_european_call_parallel(
     S0: float,
     K: float,
@@ -67,7 +135,9 @@ def price_european_call_parallel(
     sigma: float,
     T: float,
     n_paths: int = 100000,
-    n_workers: int = None
+    n_workers: int = None,
+    seed: int = 42,
+    dtype=np.float64
 ) -> tuple:
     """
     Price European call option using parallel Monte Carlo simulation.
@@ -88,6 +158,12 @@ def price_european_call_parallel(
         Total number of simulation paths
     n_workers : int, optional
         Number of parallel workers (default: CPU count)
+    seed : int, optional
+        Root seed; each worker gets an independent stream spawned from it.
+        Pass None for fresh OS entropy.
+    dtype : np.float32 or np.float64, optional
+        Precision of the simulated paths. float32 halves memory traffic and
+        its rounding error is far below the Monte Carlo standard error.
     
     Returns:
     --------
@@ -104,40 +180,10 @@ def price_european_call_parallel(
     logger.info(f"Pricing call option: S0={S0}, K={K}, r={r}, sigma={sigma}, T={T}, n_paths={n_paths}")
     
     with PerformanceLogger(logger, f"Parallel MC call pricing ({n_paths} paths)"):
-        # Determine number of workers
-        if n_workers is None:
-            n_workers = min(cpu_count(), 8)  # Cap at 8 to avoid overhead
-        
-        # Split work into batches
-        batch_size = n_paths // n_workers
-        batches = [batch_size] * n_workers
-        # Handle remainder
-        batches[-1] += n_paths - sum(batches)
-        
-        # Create worker function with fixed parameters
-        worker = partial(
-            _simulate_batch,
-            S0=S0, r=r, sigma=sigma, T=T, K=K, option_type='call'
+        price, std_error = _price_parallel(
+            S0, K, r, sigma, T, n_paths, n_workers, 'call', seed, dtype
         )
         
-        # Run parallel simulation
-        with Pool(processes=n_workers) as pool:
-            # Use different seeds for each batch
-            results = pool.starmap(
-                worker,
-                [(batch, i * 12345) for i, batch in enumerate(batches)]
-            )
-        
-        # Aggregate results
-        total_sum = sum(r[0] for r in results)
-        total_sum_sq = sum(r[1] for r in results)
-        total_count = sum(r[2] for r in results)
-        
-        # Calculate price and standard error
-        price = total_sum / total_count
-        variance = (total_sum_sq / total_count) - (price ** 2)
-        std_error = np.sqrt(variance / total_count)
-        
         logger.info(f"Call price: ${price:.4f} ± ${std_error:.4f}")
         
         return price, std_error
@@ -150,7 +196,9 @@ def price_european_put_parallel(
     sigma: float,
     T: float,
     n_paths: int = 100000,
-    n_workers: int = None
+    n_workers: int = None,
+    seed: int = 42,
+    dtype=np.float64
 ) -> tuple:
     """
     Price European put option using parallel Monte Carlo simulation.
@@ -171,6 +219,12 @@ def price_european_put_parallel(
         Total number of simulation paths
     n_workers : int, optional
         Number of parallel workers (default: CPU count)
+    seed : int, optional
+        Root seed; each worker gets an independent stream spawned from it.
+        Pass None for fresh OS entropy.
+    dtype : np.float32 or np.float64, optional
+        Precision of the simulated paths. float32 halves memory traffic and
+        its rounding error is far below the Monte Carlo standard error.
     
     Returns:
     --------
@@ -187,38 +241,10 @@ def price_european_put_parallel(
     logger.info(f"Pricing put option: S0={S0}, K={K}, r={r}, sigma={sigma}, T={T}, n_paths={n_paths}")
     
     with PerformanceLogger(logger, f"Parallel MC put pricing ({n_paths} paths)"):
-        # Determine number of workers
-        if n_workers is None:
-            n_workers = min(cpu_count(), 8)
-        
-        # Split work into batches
-        batch_size = n_paths // n_workers
-        batches = [batch_size] * n_workers
-        batches[-1] += n_paths - sum(batches)
-        
-        # Create worker function
-        worker = partial(
-            _simulate_batch,
-            S0=S0, r=r, sigma=sigma, T=T, K=K, option_type='put'
+        price, std_error = _price_parallel(
+            S0, K, r, sigma, T, n_paths, n_workers, 'put', seed, dtype
         )
         
-        # Run parallel simulation
-        with Pool(processes=n_workers) as pool:
-            results = pool.starmap(
-                worker,
-                [(batch, i * 12345) for i, batch in enumerate(batches)]
-            )
-        
-        # Aggregate results
-        total_sum = sum(r[0] for r in results)
-        total_sum_sq = sum(r[1] for r in results)
-        total_count = sum(r[2] for r in results)
-        
-        # Calculate price and standard error
-        price = total_sum / total_count
-        variance = (total_sum_sq / total_count) - (price ** 2)
-        std_error = np.sqrt(variance / total_count)
-        
         logger.info(f"Put price: ${price:.4f} ± ${std_error:.4f}")
         
         return price, std_error
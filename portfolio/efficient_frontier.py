@@ -56,11 +56,17 @@ def compute_efficient_frontier(mean_returns, cov_matrix, n_points=100,
     frontier_sharpes = []
     valid_returns = []
     
+    # Warm-start each point from the previous solution, beginning at the
+    # min variance portfolio (which sits at the first target)
+    prev_weights = min_var['weights']
+    
     for target in target_returns:
         weights, vol = optimize_target_return(
-            mean_returns, cov_matrix, target, allow_short
+            mean_returns, cov_matrix, target, allow_short,
+            init_weights=prev_weights
         )
         if weights is not None:
+            prev_weights = weights
             frontier_vols.append(vol)
             frontier_weights.append(weights)
             sharpe = (target - risk_free_rate) / vol
@@ -5,6 +5,7 @@ Classic portfolio optimization framework from Modern Portfolio Theory.
 
 import numpy as np
 import pandas as pd
+from scipy.linalg import cho_solve, solve
 from scipy.optimize import minimize
 
 
@@ -55,11 +56,58 @@ def portfolio_sharpe(weights, mean_returns, cov_matrix, risk_free_rate=0.02):
     return (ret - risk_free_rate) / vol
 
 
+def portfolio_volatility_grad(weights, cov_matrix):
+    """
+    Gradient of portfolio volatility with respect to the weights.
+    
+    ∂σ_p/∂w = Σw / σ_p
+    """
+    cov_w = np.dot(cov_matrix, weights)
+    return cov_w / np.sqrt(np.dot(weights, cov_w))
+
+
 def neg_sharpe(weights, mean_returns, cov_matrix, risk_free_rate):
     """Negative Sharpe for minimization."""
     return -portfolio_sharpe(weights, mean_returns, cov_matrix, risk_free_rate)
 
 
+def neg_sharpe_grad(weights, mean_returns, cov_matrix, risk_free_rate):
+    """
+    Analytic gradient of the negative Sharpe ratio.
+    
+    ∂(-S)/∂w = -μ/σ_p + (E[R_p] - R_f)·Σw/σ_p³
+    """
+    cov_w = np.dot(cov_matrix, weights)
+    vol = np.sqrt(np.dot(weights, cov_w))
+    excess = np.dot(weights, mean_returns) - risk_free_rate
+    return -mean_returns / vol + excess * cov_w / vol**3
+
+
+def min_variance_weights(cov_matrix, chol=None):
+    """
+    Closed-form global minimum variance weights (fully invested, no bounds).
+    
+    w = Σ⁻¹·1 / (1ᵀ·Σ⁻¹·1), solved via Cholesky rather than an explicit inverse.
+    
+    Parameters:
+    -----------
+    cov_matrix : np.array
+        Positive-definite covariance matrix
+    chol : np.array, optional
+        Lower Cholesky factor of cov_matrix; reused instead of refactoring
+    
+    Returns:
+    --------
+    np.array : Portfolio weights (sum to 1)
+    """
+    ones = np.ones(len(cov_matrix))
+    if chol is not None:
+        x = cho_solve((chol, True), ones)
+    else:
+        x = solve(cov_matrix, ones, assume_a='pos')
+    return x / x.sum()
+
+
 def optimize_sharpe(mean_returns, cov_matrix, risk_free_rate=0.02, 
                     allow_short=False):
     """
@@ -101,6 +149,7 @@ def optimize_sharpe(mean_returns, cov_matrix, risk_free_rate=0.02,
         init_weights,
         args=(mean_returns, cov_matrix, risk_free_rate),
         method='SLSQP',
+        jac=neg_sharpe_grad,
         bounds=bounds,
         constraints=constraints
     )
@@ -116,34 +165,46 @@ def optimize_sharpe(mean_returns, cov_matrix, risk_free_rate=0.02,
     }
 
 
-def optimize_min_variance(mean_returns, cov_matrix, allow_short=False):
+def optimize_min_variance(mean_returns, cov_matrix, allow_short=False, chol=None):
     """
     Find the minimum variance portfolio.
     
+    The closed-form solution is used when it already satisfies the weight
+    bounds (it is then also the bounded optimum); otherwise, or if the
+    covariance is not positive definite, SLSQP is run with the analytic
+    gradient. Pass chol (lower Cholesky factor of cov_matrix) to skip the
+    factorization when the same covariance is optimized repeatedly.
+    
     Returns:
     --------
     dict : Portfolio statistics
     """
     n_assets = len(mean_returns)
-    init_weights = np.ones(n_assets) / n_assets
+    lower = -1 if allow_short else 0
     
-    constraints = {'type': 'eq', 'fun': lambda w: np.sum(w) - 1}
+    try:
+        optimal_weights = min_variance_weights(cov_matrix, chol=chol)
+        in_bounds = lower <= optimal_weights.min() and optimal_weights.max() <= 1
+    except np.linalg.LinAlgError:
+        # Not numerically positive definite: let SLSQP handle it
+        in_bounds = False
     
-    if allow_short:
-        bounds = tuple((-1, 1) for _ in range(n_assets))
-    else:
-        bounds = tuple((0, 1) for _ in range(n_assets))
-    
-    result = minimize(
-        portfolio_volatility,
-        init_weights,
-        args=(cov_matrix,),
-        method='SLSQP',
-        bounds=bounds,
-        constraints=constraints
-    )
-    
-    optimal_weights = result.x
+    if not in_bounds:
+        init_weights = np.ones(n_assets) / n_assets
+        constraints = {'type': 'eq', 'fun': lambda w: np.sum(w) - 1}
+        bounds = tuple((lower, 1) for _ in range(n_assets))
+        
+        result = minimize(
+            portfolio_volatility,
+            init_weights,
+            args=(cov_matrix,),
+            method='SLSQP',
+            jac=portfolio_volatility_grad,
+            bounds=bounds,
+            constraints=constraints
+        )
+        
+        optimal_weights = result.x
     
     return {
         'weights': optimal_weights,
@@ -154,13 +215,17 @@ def optimize_min_variance(mean_returns, cov_matrix, allow_short=False):
 
 
 def optimize_target_return(mean_returns, cov_matrix, target_return, 
-                           allow_short=False):
+                           allow_short=False, init_weights=None):
     """
     Find minimum variance portfolio for a target return.
     Used to trace the efficient frontier.
+    
+    init_weights warm-starts the solver (default: equal weights); when
+    sweeping nearby targets, the previous solution converges much faster.
     """
     n_assets = len(mean_returns)
-    init_weights = np.ones(n_assets) / n_assets
+    if init_weights is None:
+        init_weights = np.ones(n_assets) / n_assets
     
     constraints = [
         {'type': 'eq', 'fun': lambda w: np.sum(w) - 1},
@@ -177,6 +242,7 @@ def optimize_target_return(mean_returns, cov_matrix, target_return,
         init_weights,
         args=(cov_matrix,),
         method='SLSQP',
+        jac=portfolio_volatility_grad,
         bounds=bounds,
         constraints=constraints
     )
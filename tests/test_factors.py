@@ -180,6 +180,66 @@ class TestFF3Model:
         assert len(predictions) == len(excess_returns), "Predictions wrong length"
         assert not np.any(np.isnan(predictions)), "Predictions contain NaN"
     
+    def test_precomputed_design(self, sample_data):
+        """Test fit/predict with a prebuilt design matrix match the factor_data path."""
+        excess_returns, factors, true_params = sample_data
+        
+        model = FF3Model().fit(excess_returns, factors)
+        X = model.build_design(factors)
+        model_design = FF3Model().fit(excess_returns, design=X)
+        
+        assert np.isclose(model_design.alpha, model.alpha)
+        np.testing.assert_allclose(model_design.predict(design=X), model.predict(factors))
+        np.testing.assert_allclose(model.predict(factors), model.results.fittedvalues)
+    
+    def test_fit_fast_matches_fit(self, sample_data):
+        """Test lean least-squares fit gives the same estimates as fit()."""
+        excess_returns, factors, true_params = sample_data
+        
+        model = FF3Model().fit(excess_returns, factors)
+        fast = FF3Model().fit_fast(excess_returns, factors)
+        
+        assert np.isclose(fast.alpha, model.alpha), "Fast alpha differs from fit()"
+        for factor in model.factor_names:
+            assert np.isclose(fast.betas[factor], model.betas[factor]), f"Fast {factor} beta differs"
+        assert np.isclose(fast.sigma2, model.results.mse_resid), "Residual variance differs"
+    
+    def test_fit_fast_predict(self, sample_data):
+        """Test predict works after fit_fast() and matches the fit() predictions."""
+        excess_returns, factors, true_params = sample_data
+        
+        model = FF3Model().fit(excess_returns, factors)
+        fast = FF3Model().fit_fast(excess_returns, factors)
+        
+        np.testing.assert_allclose(fast.predict(factors), model.predict(factors))
+        
+        # Plain ndarray design: same predictions, positional index
+        X = model.build_design(factors).to_numpy()
+        np.testing.assert_allclose(fast.predict(design=X), model.predict(factors))
+        
+        # Refitting with fit_fast() clears the statsmodels results
+        model.fit_fast(excess_returns, factors)
+        with pytest.raises(ValueError, match="not fitted"):
+            model.summary()
+    
+    def test_fit_batch_matches_fit(self, sample_data):
+        """Test batched fit gives the same coefficients as per-stock fits."""
+        excess_returns, factors, true_params = sample_data
+        
+        Y = np.column_stack([excess_returns, 0.5 * excess_returns + factors['SMB']])
+        batch = FF3Model().fit_batch(Y, factors)
+        
+        assert batch.betas_matrix.shape == (2, 3), "Betas matrix has wrong shape"
+        
+        for i in range(Y.shape[1]):
+            model = FF3Model().fit(pd.Series(Y[:, i], index=factors.index), factors)
+            assert np.isclose(batch.alphas[i], model.alpha), "Batched alpha differs from fit()"
+            np.testing.assert_allclose(
+                batch.betas_matrix[i],
+                [model.betas[f] for f in model.factor_names],
+                err_msg="Batched betas differ from fit()"
+            )
+    
     def test_fit_without_data_raises_error(self):
         """Test that fitting without data raises appropriate error."""
         model = FF3Model()
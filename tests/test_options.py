@@ -11,8 +11,8 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from options.black_scholes import black_scholes_call, black_scholes_put
-from options.european_options import price_european_call, price_european_put
+from options.black_scholes import black_scholes_call, black_scholes_call_vec, black_scholes_put
+from options.european_options import price_european_call, price_european_put, payoff_call_inplace
 from options.gbm import simulate_gbm
 from options.greeks import (
     delta_call, delta_put, gamma, vega, 
@@ -47,6 +47,15 @@ class TestBlackScholes:
         
         assert abs(lhs - rhs) < 1e-10, f"Put-call parity violated: {lhs} != {rhs}"
     
+    def test_vectorized_call_matches_scalar(self):
+        """Test vectorized call pricing matches the scalar formula."""
+        strikes = np.array([80.0, 90.0, 100.0, 110.0, 120.0])
+        
+        prices = black_scholes_call_vec(100, strikes, 0.05, 0.20, 1.0)
+        expected = [black_scholes_call(100, K, 0.05, 0.20, 1.0) for K in strikes]
+        
+        np.testing.assert_allclose(prices, expected, rtol=1e-12)
+    
     def test_deep_itm_call(self):
         """Test deep in-the-money call behaves like stock."""
         # Deep ITM call should be worth approximately S - K*exp(-rT)
@@ -117,6 +126,16 @@ class TestMonteCarlo:
             prices.extend([call, put])
         
         assert all(p > 0 for p in prices), "All option prices must be positive"
+    
+    def test_payoff_call_inplace(self):
+        """Test in-place call payoff matches the allocating expression."""
+        S = np.linspace(50, 150, 100)
+        out = np.empty_like(S)
+        
+        result = payoff_call_inplace(S, 100.0, 10.45, out)
+        
+        assert result is out
+        np.testing.assert_allclose(out, np.maximum(S - 100.0, 0) - 10.45)
 
 
 class TestGBM:
@@ -6,6 +6,7 @@ Tests individual functions and components in isolation.
 import pytest
 import sys
 from pathlib import Path
+from collections import OrderedDict
 import numpy as np
 import pandas as pd
 
@@ -269,34 +270,193 @@ class TestDataValidation:
         
         with pytest.raises(ValidationError):
             validate_covariance_matrix(cov)
-    
-    def test_valid_weights(self):
-        """Test validation of valid portfolio weights."""
-        from utils.validation import validate_weights
-        
-        weights = np.array([0.3, 0.25, 0.2, 0.15, 0.1])
-        
-        # Should not raise
-        validate_weights(weights, allow_short=False)
-    
-    def test_invalid_weights_sum(self):
-        """Test validation of weights that don't sum to 1."""
-        from utils.validation import validate_weights, ValidationError
-        
-        weights = np.array([0.3, 0.25, 0.2, 0.15])  # Sums to 0.9
-        
+
+    def test_trusted_covariance_matrix(self):
+        """Test trusted validation checks only shape and symmetry."""
+        from utils.validation import validate_covariance_matrix, ValidationError
+
+        # Symmetric but not positive semi-definite
+        cov = np.array([
+            [0.04, 0.1],
+            [0.1, 0.01]
+        ])
+
+        validate_covariance_matrix(cov, trusted=True)
         with pytest.raises(ValidationError):
-            validate_weights(weights, allow_short=False)
-    
-    def test_invalid_weights_negative(self):
-        """Test validation of negative weights when not allowed."""
-        from utils.validation import validate_weights, ValidationError
-        
-        weights = np.array([0.4, 0.3, 0.5, -0.2])  # Has negative
-        
+            validate_covariance_matrix(cov)
+
+        # Non-symmetric is still rejected
+        with pytest.raises(ValidationError, match="symmetric"):
+            validate_covariance_matrix(np.array([[0.04, 0.01], [0.02, 0.04]]), trusted=True)
+
+    def test_covariance_validation_cache(self, monkeypatch):
+        """Test that cached validation is keyed on matrix contents."""
+        import scipy.linalg
+        from utils import validation
+        from utils.validation import validate_covariance_matrix, ValidationError
+
+        calls = []
+        cholesky = scipy.linalg.cholesky
+
+        def counting_cholesky(*args, **kwargs):
+            calls.append(1)
+            return cholesky(*args, **kwargs)
+
+        monkeypatch.setattr(scipy.linalg, "cholesky", counting_cholesky)
+        monkeypatch.setattr(validation, "_cov_validation_cache", OrderedDict())
+
+        cov = np.array([[0.04, 0.01], [0.01, 0.09]])
+        validate_covariance_matrix(cov)
+        assert len(validation._cov_validation_cache) == 1
+        assert len(calls) == 1
+
+        # Equal contents in a new array: answered from the cache
+        validate_covariance_matrix(cov.copy())
+        assert len(calls) == 1
+
+        # Same shape, new contents: must be validated again
+        cov[0, 1] = cov[1, 0] = 0.1
         with pytest.raises(ValidationError):
+            validate_covariance_matrix(cov)
+        assert len(calls) == 2
+        assert len(validation._cov_validation_cache) == 1
+
+
+    def test_covariance_validation_skip_if_seen(self, monkeypatch):
+        """Test that only opted-in calls skip read-only matrices already seen."""
+        import scipy.linalg
+        from utils import validation
+        from utils.validation import validate_covariance_matrix, ValidationError
+
+        calls = []
+        cholesky = scipy.linalg.cholesky
+
+        def counting_cholesky(*args, **kwargs):
+            calls.append(1)
+            return cholesky(*args, **kwargs)
+
+        monkeypatch.setattr(scipy.linalg, "cholesky", counting_cholesky)
+        monkeypatch.setattr(validation, "_cov_validation_cache", OrderedDict())
+
+        frozen = np.array([[0.04, 0.01], [0.01, 0.09]])
+        frozen.setflags(write=False)
+        validate_covariance_matrix(frozen, skip_if_seen=True)
+        validate_covariance_matrix(frozen, skip_if_seen=True)
+        assert len(calls) == 1
+
+        # Without the opt-in, an owning array edited in place is caught
+        frozen.setflags(write=True)
+        frozen[0, 1] = frozen[1, 0] = 0.1
+        frozen.setflags(write=False)
+        with pytest.raises(ValidationError):
+            validate_covariance_matrix(frozen)
+
+    def test_singular_covariance_matrix(self):
+        """Test that PSD but singular matrices pass via the eigenvalue fallback."""
+        from utils.validation import validate_covariance_matrix, ValidationError
+
+        # Perfectly correlated assets: rank 1, Cholesky fails
+        vols = np.array([0.2, 0.15, 0.25])
+        validate_covariance_matrix(np.outer(vols, vols))
+
+        # Zero-variance asset is still rejected
+        with pytest.raises(ValidationError, match="variances"):
+            validate_covariance_matrix(np.diag([0.04, 0.0, 0.0625]))
+
+    @pytest.mark.parametrize("returns, match", [
+        (np.array([0.01, -0.02, 1.0, -1.0]), None),
+        (np.array([0.01, np.nan, np.inf]), "1 NaN and 1 inf"),
+        (np.array([0.01, -1.5, 2.0]), "2 values > 100%"),
+    ], ids=["valid", "non_finite", "extreme"])
+    def test_returns_validation(self, returns, match):
+        """Test returns validation fast path and error messages."""
+        from utils.validation import validate_returns, ValidationError
+
+        if match is None:
+            validate_returns(returns)
+        else:
+            with pytest.raises(ValidationError, match=match):
+                validate_returns(returns)
+
+    def test_option_params_batch_validation(self):
+        """Test vectorized option parameter validation over a strike grid."""
+        from utils.validation import validate_option_params_batch, ValidationError
+
+        strikes = np.linspace(80.0, 120.0, 41)
+        validate_option_params_batch(100.0, strikes, 0.05, 0.20, 1.0)
+
+        strikes[7] = -1.0
+        with pytest.raises(ValidationError, match=r"index \(7,\): Strike price"):
+            validate_option_params_batch(100.0, strikes, 0.05, 0.20, 1.0)
+
+    def test_validate_inputs_decorator(self):
+        """Test decorator validation for positional, keyword and default arguments."""
+        from utils.validation import validate_inputs, validate_positive, ValidationError
+
+        @validate_inputs(S0=validate_positive, T=validate_positive)
+        def price(S0, K, T=-1.0):
+            return S0
+
+        assert price(100.0, 100.0, 1.0) == 100.0
+        assert price(100.0, K=100.0, T=1.0) == 100.0
+        with pytest.raises(ValidationError, match=r"In price\(\): S0"):
+            price(-100.0, 100.0, 1.0)
+        with pytest.raises(ValidationError, match="T must be positive"):
+            price(100.0, 100.0)
+
+        # Parameter names clashing with the generated helpers use the bind path
+        @validate_inputs(_vi_S0=validate_positive)
+        def clashing(_vi_S0, K=100.0):
+            return _vi_S0
+
+        assert clashing(100.0) == 100.0
+        with pytest.raises(ValidationError, match=r"In clashing\(\): _vi_S0"):
+            clashing(-100.0)
+
+    @pytest.mark.parametrize("weights, should_raise", [
+        (np.array([0.3, 0.25, 0.2, 0.15, 0.1]), False),
+        (np.array([0.3, 0.25, 0.2, 0.15]), True),        # Sums to 0.9
+        (np.array([0.4, 0.3, 0.5, -0.2]), True),         # Has negative
+    ], ids=["valid", "invalid_sum", "invalid_negative"])
+    def test_weights_validation(self, weights, should_raise):
+        """Test validation of portfolio weights (long-only)."""
+        from utils.validation import validate_weights, ValidationError
+
+        if should_raise:
+            with pytest.raises(ValidationError):
+                validate_weights(weights, allow_short=False)
+        else:
             validate_weights(weights, allow_short=False)
 
+    def test_weights_validation_batch(self):
+        """Test vectorized validation of several weight vectors at once."""
+        from utils.validation import validate_weights_batch, ValidationError
+
+        valid = np.array([
+            [0.3, 0.25, 0.2, 0.15, 0.1],
+            [0.2, 0.2, 0.2, 0.2, 0.2]
+        ])
+
+        # Should not raise
+        validate_weights_batch(valid, allow_short=False)
+
+        # Second row sums to 0.9, third row has a negative weight
+        invalid = np.array([
+            [0.3, 0.25, 0.2, 0.15, 0.1],
+            [0.3, 0.25, 0.2, 0.15, 0.0],
+            [0.4, 0.3, 0.5, -0.2, 0.0]
+        ])
+
+        with pytest.raises(ValidationError, match="row 1"):
+            validate_weights_batch(invalid, allow_short=False)
+
+        # First bad row fails a later check (negative) than the second (sum)
+        with pytest.raises(ValidationError, match="Negative weights not allowed in row 0"):
+            validate_weights_batch(np.array([[0.5, 0.6, -0.1], [0.5, 0.4, 0.2]]))
+
+        # Same sum tolerance as validate_weights
+        validate_weights_batch(np.array([[0.5, 0.50010, 0.0]]))
+
 
 class TestCalculationAccuracy:
     """Test accuracy of calculations used in app."""
@@ -3,58 +3,97 @@ Integration tests for Streamlit app.
 Tests end-to-end workflows and page interactions.
 """
 
+import math
 import pytest
 import sys
 from pathlib import Path
+from types import SimpleNamespace
 import numpy as np
 import pandas as pd
-from unittest.mock import Mock, patch
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from options.black_scholes import black_scholes_call_vec
+from options.european_options import price_european_call
+from portfolio.markowitz import optimize_sharpe, optimize_target_return, portfolio_return
+from portfolio.risk_parity import optimize_risk_parity
+from portfolio.efficient_frontier import compute_efficient_frontier
+from factors.ff3_model import FF3Model
+from factors.ff5_model import FF5Model
+
+# Seed for per-test random generators (no global NumPy state)
+RNG_SEED = 42
+
+# 5-asset universe: volatilities with a constant 0.3 pairwise correlation.
+# Built once at import and write-protected so tests can share them safely.
+_VOLS5 = np.array([0.20, 0.15, 0.25, 0.10, 0.18])
+_EQUI_CORR_5 = np.full((5, 5), 0.3)
+np.fill_diagonal(_EQUI_CORR_5, 1.0)
+_COV5 = np.outer(_VOLS5, _VOLS5) * _EQUI_CORR_5
+
+# Same volatilities with heterogeneous pairwise correlations
+_CORR_5 = np.array([
+    [1.0, 0.3, 0.4, 0.2, 0.35],
+    [0.3, 1.0, 0.35, 0.25, 0.3],
+    [0.4, 0.35, 1.0, 0.3, 0.4],
+    [0.2, 0.25, 0.3, 1.0, 0.2],
+    [0.35, 0.3, 0.4, 0.2, 1.0]
+])
+_COV5_HETERO = np.outer(_VOLS5, _VOLS5) * _CORR_5
+
+for _arr in (_VOLS5, _EQUI_CORR_5, _COV5, _CORR_5, _COV5_HETERO):
+    _arr.setflags(write=False)
+
+
+@pytest.fixture(scope="module")
+def opt_inputs():
+    """User inputs for the ATM reference call: (S0, K, r, sigma, T)."""
+    return (100.0, 100.0, 0.05, 0.20, 1.0)
+
+
+@pytest.fixture(scope="module")
+def spot_grid():
+    """Spot price grid (0.5K to 1.5K around K=100) for payoff-style tests."""
+    grid = np.linspace(50.0, 150.0, 100)
+    grid.setflags(write=False)
+    return grid
+
 
 class TestOptionsPageIntegration:
     """Integration tests for Options pricing page workflow."""
     
-    def test_complete_black_scholes_workflow(self):
+    def test_complete_black_scholes_workflow(self, opt_inputs, bs_price):
         """Test complete Black-Scholes pricing workflow."""
-        from options.black_scholes import black_scholes_call
-        from options.greeks import delta_call, gamma, vega, theta_call, rho_call
         from utils.validation import validate_option_params
         
-        # User inputs
-        S0, K, r, sigma, T = 100.0, 100.0, 0.05, 0.20, 1.0
-        
         # Validate inputs
-        validate_option_params(S0, K, r, sigma, T)
-        
-        # Calculate price
-        price = black_scholes_call(S0, K, r, sigma, T)
-        
-        # Calculate Greeks
-        delta = delta_call(S0, K, T, r, sigma)
-        gamma_val = gamma(S0, K, T, r, sigma)
-        vega_val = vega(S0, K, T, r, sigma)
-        theta = theta_call(S0, K, T, r, sigma)
-        rho = rho_call(S0, K, T, r, sigma)
+        validate_option_params(*opt_inputs)
         
-        # Verify results
-        assert price > 0
-        assert 0 < delta < 1  # Call delta between 0 and 1
-        assert gamma_val > 0  # Gamma always positive
-        assert vega_val > 0   # Vega always positive
-        assert theta < 0      # Theta negative for long call
-        assert rho > 0        # Rho positive for call
+        # Price comes from the session-cached fixture
+        assert bs_price > 0
     
-    def test_complete_monte_carlo_workflow(self):
+    @pytest.mark.parametrize("greek, predicate", [
+        ('delta', lambda v: 0 < v < 1),  # Call delta between 0 and 1
+        ('gamma', lambda v: v > 0),      # Gamma always positive
+        ('vega', lambda v: v > 0),       # Vega always positive
+        ('theta', lambda v: v < 0),      # Theta negative for long call
+        ('rho', lambda v: v > 0),        # Rho positive for call
+    ])
+    def test_greek(self, bs_greeks, greek, predicate):
+        """Test each Black-Scholes Greek of the reference call independently."""
+        assert predicate(bs_greeks[greek])
+    
+    @pytest.mark.parametrize("n_paths", [
+        20_000,
+        pytest.param(100_000, marks=pytest.mark.slow)
+    ])
+    def test_complete_monte_carlo_workflow(self, bs_price, n_paths):
         """Test complete Monte Carlo pricing workflow."""
-        from options.european_options import price_european_call
         from utils.validation import validate_option_params, validate_monte_carlo_params
         
         # User inputs
         S0, K, r, sigma, T = 100.0, 100.0, 0.05, 0.20, 1.0
-        n_paths = 100000
         
         # Validate inputs
         validate_option_params(S0, K, r, sigma, T)
@@ -66,13 +105,13 @@ class TestOptionsPageIntegration:
         # Verify result
         assert price > 0
         # Should be close to Black-Scholes
-        from options.black_scholes import black_scholes_call
-        bs_price = black_scholes_call(S0, K, r, sigma, T)
-        assert abs(price - bs_price) / bs_price < 0.05  # Within 5%
+        # Tolerance widens with the Monte Carlo standard error ~ 1/sqrt(n_paths)
+        assert abs(price - bs_price) / bs_price < 0.03 + 3 / np.sqrt(n_paths)
     
-    @pytest.mark.skip(reason="Known issue with partial/starmap argument passing - requires refactoring")
     def test_parallel_monte_carlo_workflow(self):
         """Test parallel Monte Carlo workflow."""
+        # Imported here: monte_carlo_parallel depends on the top-level utils
+        # package, which the app tests shadow with app/utils at collection time
         from options.monte_carlo_parallel import price_european_call_parallel
         from utils.validation import validate_option_params
         
@@ -91,51 +130,42 @@ class TestOptionsPageIntegration:
         assert std_err > 0
         assert std_err < price * 0.01  # Standard error should be small
     
-    def test_payoff_diagram_data_generation(self):
+    def test_payoff_diagram_data_generation(self, spot_grid):
         """Test payoff diagram data generation."""
-        import numpy as np
-        
-        S0, K = 100.0, 100.0
+        K = 100.0
         price = 10.45
         
-        # Generate spot price range
-        S_range = np.linspace(0.5 * K, 1.5 * K, 100)
-        
-        # Calculate call payoff
-        intrinsic = np.maximum(S_range - K, 0)
-        payoff = intrinsic - price
+        # Call payoff over the shared spot grid in one fused expression
+        payoff = np.maximum(spot_grid - K, 0.0) - price
         
         # Verify data
-        assert len(S_range) == 100
         assert len(payoff) == 100
         assert payoff[0] < 0  # Out of money loses premium
         assert payoff[-1] > 0  # Deep in money is profitable
 
 
+@pytest.fixture(scope="module")
+def cov5():
+    """5-asset inputs: read-only mean returns and equicorrelated covariance."""
+    mean_returns = np.array([0.12, 0.10, 0.14, 0.08, 0.11])
+    mean_returns.setflags(write=False)
+    
+    return SimpleNamespace(mean_returns=mean_returns, cov_matrix=_COV5)
+
+
 class TestPortfolioPageIntegration:
     """Integration tests for Portfolio optimization page workflow."""
     
-    def test_complete_max_sharpe_workflow(self):
+    def test_complete_max_sharpe_workflow(self, cov5):
         """Test complete Maximum Sharpe Ratio workflow."""
-        from portfolio.markowitz import optimize_sharpe
         from utils.validation import validate_covariance_matrix, validate_weights
         
         # User inputs (5-asset example)
-        np.random.seed(42)
-        mean_returns = np.array([0.12, 0.10, 0.14, 0.08, 0.11])
-        vols = np.array([0.20, 0.15, 0.25, 0.10, 0.18])
-        corr = np.array([
-            [1.0, 0.3, 0.4, 0.2, 0.35],
-            [0.3, 1.0, 0.35, 0.25, 0.3],
-            [0.4, 0.35, 1.0, 0.3, 0.4],
-            [0.2, 0.25, 0.3, 1.0, 0.2],
-            [0.35, 0.3, 0.4, 0.2, 1.0]
-        ])
-        cov_matrix = np.outer(vols, vols) * corr
+        mean_returns, cov_matrix = cov5.mean_returns, _COV5_HETERO
         risk_free_rate = 0.02
         
-        # Validate inputs
-        validate_covariance_matrix(cov_matrix)
+        # Validate inputs (built from vols and a valid correlation, so PSD by construction)
+        validate_covariance_matrix(cov_matrix, trusted=True)
         
         # Optimize
         result = optimize_sharpe(mean_returns, cov_matrix, risk_free_rate=risk_free_rate)
@@ -150,19 +180,15 @@ class TestPortfolioPageIntegration:
         assert 'sharpe' in result
         assert result['sharpe'] > 0
     
-    def test_complete_risk_parity_workflow(self):
+    def test_complete_risk_parity_workflow(self, cov5):
         """Test complete Risk Parity workflow."""
-        from portfolio.risk_parity import optimize_risk_parity
         from utils.validation import validate_covariance_matrix
         
         # User inputs
-        np.random.seed(42)
-        vols = np.array([0.20, 0.15, 0.25, 0.10, 0.18])
-        corr = np.eye(5) + 0.3 * (np.ones((5, 5)) - np.eye(5))
-        cov_matrix = np.outer(vols, vols) * corr
+        cov_matrix = cov5.cov_matrix
         
-        # Validate inputs
-        validate_covariance_matrix(cov_matrix)
+        # Validate inputs (built from vols and a valid correlation, so PSD by construction)
+        validate_covariance_matrix(cov_matrix, trusted=True)
         
         # Optimize
         result = optimize_risk_parity(cov_matrix)
@@ -175,79 +201,89 @@ class TestPortfolioPageIntegration:
         risk_contrib = result['risk_contributions']
         assert np.std(risk_contrib) < 0.05
     
-    def test_efficient_frontier_workflow(self):
+    @pytest.mark.parametrize("n_points", [
+        10,
+        pytest.param(50, marks=pytest.mark.slow)
+    ])
+    def test_efficient_frontier_workflow(self, cov5, n_points):
         """Test efficient frontier computation workflow."""
-        from portfolio.efficient_frontier import compute_efficient_frontier
         from utils.validation import validate_covariance_matrix
         
         # User inputs
-        np.random.seed(42)
-        mean_returns = np.array([0.12, 0.10, 0.14, 0.08, 0.11])
-        vols = np.array([0.20, 0.15, 0.25, 0.10, 0.18])
-        corr = np.eye(5) + 0.3 * (np.ones((5, 5)) - np.eye(5))
-        cov_matrix = np.outer(vols, vols) * corr
+        mean_returns, cov_matrix = cov5.mean_returns, cov5.cov_matrix
         
-        # Validate inputs
-        validate_covariance_matrix(cov_matrix)
+        # Validate inputs (built from vols and a valid correlation, so PSD by construction)
+        validate_covariance_matrix(cov_matrix, trusted=True)
         
         # Compute frontier
         result = compute_efficient_frontier(
-            mean_returns, cov_matrix, n_points=50
+            mean_returns, cov_matrix, n_points=n_points
         )
         
         # Verify results
-        assert len(result['returns']) == 50
-        assert len(result['volatilities']) == 50
-        assert len(result['weights']) == 50
+        assert len(result['returns']) == n_points
+        assert len(result['volatilities']) == n_points
+        assert len(result['weights']) == n_points
         
         # All portfolios should be valid
-        for weights in result['weights']:
-            assert abs(weights.sum() - 1.0) < 1e-6
-            assert np.all(weights >= -1e-6)
+        W = np.asarray(result['weights'])
+        np.testing.assert_allclose(W.sum(axis=1), 1.0, atol=1e-6)
+        assert W.min() >= -1e-6
     
     def test_allocation_visualization_data(self):
         """Test allocation visualization data preparation."""
-        import pandas as pd
-        
         # Sample results
         asset_names = ['AAPL', 'MSFT', 'GOOGL', 'AMZN', 'META']
         weights = np.array([0.30, 0.25, 0.20, 0.15, 0.10])
         
-        # Create allocation dataframe
-        allocation_df = pd.DataFrame({
-            'Asset': asset_names,
-            'Weight': weights,
-            'Weight %': weights * 100
-        })
-        allocation_df = allocation_df.sort_values('Weight', ascending=False)
+        # Order assets by descending weight
+        order = np.argsort(-weights)
         
         # Verify data
-        assert len(allocation_df) == 5
-        assert allocation_df['Weight'].sum() == pytest.approx(1.0)
-        assert allocation_df.iloc[0]['Asset'] == 'AAPL'  # Highest weight
+        assert len(order) == 5
+        assert math.isclose(weights.sum(), 1.0, abs_tol=1e-9)
+        assert asset_names[order[0]] == 'AAPL'  # Highest weight
+
 
+def _factor_returns(factor_data, betas, alpha, noise_std, rng):
+    """
+    Synthetic stock returns alpha + F @ beta + noise in one fused pass.
+    
+    `betas` maps factor column names to loadings; the noise is drawn into the
+    output buffer and the factor term accumulated in place. Returned as a
+    Series on the factor index, as FF3Model.fit expects.
+    """
+    F = factor_data[list(betas)].to_numpy()
+    out = np.empty(len(F))
+    rng.standard_normal(out=out)
+    out *= noise_std
+    out += alpha
+    out += F @ np.fromiter(betas.values(), dtype=float)
+    return pd.Series(out, index=factor_data.index)
 
+
+@pytest.fixture(scope="module")
+def fitted_ff3(ff3_daily_3y):
+    """FF3 model fitted once on a stock with a strong market beta (1.5)."""
+    rng = np.random.default_rng(RNG_SEED)
+    stock_returns = _factor_returns(ff3_daily_3y, {'Mkt-RF': 1.5}, 0.0001, 0.005, rng)
+    model = FF3Model()
+    model.fit(stock_returns, ff3_daily_3y)
+    return model, stock_returns
+
+
+@pytest.mark.xdist_group("factor_models")
 class TestFactorModelsPageIntegration:
     """Integration tests for Factor Models page workflow."""
     
-    def test_complete_ff3_workflow(self):
+    def test_complete_ff3_workflow(self, ff3_daily_3y):
         """Test complete FF3 analysis workflow."""
-        from factors.ff3_model import FF3Model
-        from factors.data_loader import generate_synthetic_factors
-        
-        # Generate synthetic data
-        factor_data = generate_synthetic_factors(model='3', frequency='daily', years=3)
+        factor_data = ff3_daily_3y
         
         # Generate stock returns
-        np.random.seed(42)
-        n_obs = len(factor_data)
-        stock_returns = (
-            0.0001 +
-            1.2 * factor_data['Mkt-RF'] +
-            0.3 * factor_data['SMB'] +
-            -0.2 * factor_data['HML'] +
-            np.random.normal(0, 0.01, n_obs)
-        )
+        rng = np.random.default_rng(RNG_SEED)
+        betas = {'Mkt-RF': 1.2, 'SMB': 0.3, 'HML': -0.2}
+        stock_returns = _factor_returns(factor_data, betas, 0.0001, 0.01, rng)
         
         # Fit model
         model = FF3Model()
@@ -263,26 +299,14 @@ class TestFactorModelsPageIntegration:
         assert len(summary['betas']) == 3
         assert 0 <= summary['r_squared'] <= 1
     
-    def test_complete_ff5_workflow(self):
+    def test_complete_ff5_workflow(self, ff5_daily_3y):
         """Test complete FF5 analysis workflow."""
-        from factors.ff5_model import FF5Model
-        from factors.data_loader import generate_synthetic_factors
-        
-        # Generate synthetic data
-        factor_data = generate_synthetic_factors(model='5', frequency='daily', years=3)
+        factor_data = ff5_daily_3y
         
         # Generate stock returns
-        np.random.seed(42)
-        n_obs = len(factor_data)
-        stock_returns = (
-            0.0001 +
-            1.1 * factor_data['Mkt-RF'] +
-            0.2 * factor_data['SMB'] +
-            -0.1 * factor_data['HML'] +
-            0.25 * factor_data['RMW'] +
-            -0.15 * factor_data['CMA'] +
-            np.random.normal(0, 0.01, n_obs)
-        )
+        rng = np.random.default_rng(RNG_SEED)
+        betas = {'Mkt-RF': 1.1, 'SMB': 0.2, 'HML': -0.1, 'RMW': 0.25, 'CMA': -0.15}
+        stock_returns = _factor_returns(factor_data, betas, 0.0001, 0.01, rng)
         
         # Fit model
         model = FF5Model()
@@ -296,25 +320,11 @@ class TestFactorModelsPageIntegration:
         assert 'RMW' in summary['betas']
         assert 'CMA' in summary['betas']
     
-    def test_residual_analysis_workflow(self):
+    def test_residual_analysis_workflow(self, ff3_daily_3y, fitted_ff3):
         """Test residual analysis workflow."""
-        from factors.ff3_model import FF3Model
-        from factors.data_loader import generate_synthetic_factors
-        
-        # Generate data
-        factor_data = generate_synthetic_factors(model='3', frequency='daily', years=1)
-        
-        np.random.seed(42)
+        factor_data = ff3_daily_3y
+        model, stock_returns = fitted_ff3
         n_obs = len(factor_data)
-        stock_returns = (
-            0.0001 +
-            1.2 * factor_data['Mkt-RF'] +
-            np.random.normal(0, 0.01, n_obs)
-        )
-        
-        # Fit model
-        model = FF3Model()
-        model.fit(stock_returns, factor_data)
         
         # Get predictions
         predictions = model.predict(factor_data)
@@ -328,25 +338,10 @@ class TestFactorModelsPageIntegration:
         # Residuals should be smaller than returns
         assert residuals.std() < stock_returns.std()
     
-    def test_significance_testing_workflow(self):
+    def test_significance_testing_workflow(self, fitted_ff3):
         """Test statistical significance testing workflow."""
-        from factors.ff3_model import FF3Model
-        from factors.data_loader import generate_synthetic_factors
-        
-        # Generate data with significant market beta
-        factor_data = generate_synthetic_factors(model='3', frequency='daily', years=3)
-        
-        np.random.seed(42)
-        n_obs = len(factor_data)
-        stock_returns = (
-            0.0001 +
-            1.5 * factor_data['Mkt-RF'] +  # Strong market exposure
-            np.random.normal(0, 0.005, n_obs)  # Low noise
-        )
-        
-        # Fit model
-        model = FF3Model()
-        model.fit(stock_returns, factor_data)
+        # Stock with strong market exposure and low noise
+        model, _ = fitted_ff3
         
         # Get summary
         summary = model.summary()
@@ -373,46 +368,36 @@ class TestCrossPageIntegration:
     
     def test_options_to_portfolio_data_flow(self):
         """Test data flow from options to portfolio context."""
-        from options.black_scholes import black_scholes_call
-        from portfolio.markowitz import portfolio_return
-        
-        # Price multiple options (could be used in portfolio)
-        strikes = [90, 100, 110]
+        # Price multiple options (could be used in portfolio) in one batch
+        strikes = np.array([90, 100, 110], dtype=np.float64)
         S0, r, sigma, T = 100.0, 0.05, 0.20, 1.0
         
-        option_prices = [black_scholes_call(S0, K, r, sigma, T) for K in strikes]
+        option_prices = black_scholes_call_vec(S0, strikes, r, sigma, T)
         
         # Use in portfolio context
         weights = np.array([0.33, 0.34, 0.33])
-        mean_returns = np.array(option_prices) / S0  # Simplified returns
+        mean_returns = option_prices / S0  # Simplified returns
         
         portfolio_ret = portfolio_return(weights, mean_returns)
         
         assert portfolio_ret > 0
     
-    def test_factor_model_to_portfolio_integration(self):
+    def test_factor_model_to_portfolio_integration(self, ff3_daily_1y):
         """Test using factor model results in portfolio optimization."""
-        from factors.ff3_model import FF3Model
-        from factors.data_loader import generate_synthetic_factors
-        from portfolio.markowitz import optimize_sharpe
-        
         # Analyze multiple stocks with factor models
-        factor_data = generate_synthetic_factors(model='3', frequency='daily', years=1)
+        factor_data = ff3_daily_1y
         
         n_stocks = 3
-        betas = []
-        
-        for i in range(n_stocks):
-            np.random.seed(42 + i)
-            stock_returns = (
-                0.0001 +
-                (1.0 + i*0.2) * factor_data['Mkt-RF'] +
-                np.random.normal(0, 0.01, len(factor_data))
-            )
-            
-            model = FF3Model()
-            model.fit(stock_returns, factor_data)
-            betas.append(model.betas['Mkt-RF'])
+        rng = np.random.default_rng(RNG_SEED)
+        
+        # One column of returns per stock, fitted with a single lstsq solve
+        Y = np.column_stack([
+            _factor_returns(factor_data, {'Mkt-RF': 1.0 + i*0.2}, 0.0001, 0.01, rng)
+            for i in range(n_stocks)
+        ])
+        betas_mkt = FF3Model().fit_batch(Y, factor_data).betas_matrix[:, 0]
+        
+        assert np.all(np.abs(betas_mkt - np.array([1.0, 1.2, 1.4])) < 0.3)
         
         # Use betas to construct portfolio
         # (In practice, would use expected returns based on factor exposures)
@@ -469,8 +454,6 @@ class TestErrorHandling:
     
     def test_optimization_failure_handling(self):
         """Test handling of optimization failures."""
-        from portfolio.markowitz import optimize_target_return
-        
         # Impossible target return
         mean_returns = np.array([0.08, 0.10, 0.12])
         cov_matrix = np.diag([0.04, 0.0225, 0.01])
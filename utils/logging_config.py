@@ -3,12 +3,48 @@ Logging configuration for quant-fundamentals.
 Provides structured logging across all modules.
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
+import time
 from pathlib import Path
 from datetime import datetime
 
 
+# One background listener per log file, shared by every logger writing to it
+_file_queues = {}
+
+
+def _queued_file_handler(log_file: str, formatter: logging.Formatter) -> logging.Handler:
+    """
+    Return a QueueHandler feeding a background thread that writes log_file.
+    
+    QueueHandler.prepare() still runs on the calling thread: it merges the
+    message arguments and any traceback into the record before enqueueing it.
+    The final line formatting and the file I/O happen on the listener thread,
+    which is drained and stopped at interpreter exit.
+    
+    The FileHandler is created by the first call for a given file and shared
+    afterwards, so its formatter wins; the formatter passed by later calls
+    for the same file is ignored. Levels are not shared, because each caller
+    gets its own QueueHandler.
+    """
+    key = str(Path(log_file).resolve())
+    if key not in _file_queues:
+        file_handler = logging.FileHandler(log_file)
+        file_handler.setFormatter(formatter)
+        
+        log_queue = queue.Queue(-1)
+        listener = logging.handlers.QueueListener(log_queue, file_handler)
+        listener.start()
+        atexit.register(listener.stop)
+        _file_queues[key] = log_queue
+    
+    return logging.handlers.QueueHandler(_file_queues[key])
+
+
 def setup_logger(
     name: str,
     level: int = logging.INFO,
@@ -25,7 +61,9 @@ def setup_logger(
     level : int
         Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
     log_file : str, optional
-        Path to log file. If None, no file logging.
+        Path to log file. If None, no file logging. Records are written by
+        a background thread, so file I/O stays off the calling thread. The
+        line format is fixed by the first logger set up for a given file.
     console : bool
         Whether to log to console
     
@@ -58,9 +96,8 @@ def setup_logger(
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
         
-        file_handler = logging.FileHandler(log_file)
+        file_handler = _queued_file_handler(log_file, formatter)
         file_handler.setLevel(level)
-        file_handler.setFormatter(formatter)
         logger.addHandler(file_handler)
     
     return logger
@@ -112,18 +149,30 @@ class PerformanceLogger:
         self.logger = logger
         self.operation = operation
         self.start_time = None
+        self._enabled = True
+        # Monotonic, high-resolution clock; bound once to skip lookups per event
+        self._clock = time.perf_counter_ns
     
     def __enter__(self):
-        """Start timing."""
-        import time
-        self.start_time = time.time()
-        self.logger.debug(f"Starting: {self.operation}")
+        """Start timing (skipped when the logger would discard INFO)."""
+        self._enabled = self.logger.isEnabledFor(logging.INFO)
+        if not self._enabled:
+            self.start_time = None
+            return self
+        
+        self.start_time = self._clock()
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Starting: {self.operation}")
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """End timing and log duration."""
-        import time
-        duration = time.time() - self.start_time
+        if not self._enabled:
+            if exc_type is not None and self.logger.isEnabledFor(logging.ERROR):
+                self.logger.error(f"Failed: {self.operation} - {exc_val}")
+            return False
+        
+        duration = (self._clock() - self.start_time) / 1e9
         
         if exc_type is None:
             self.logger.info(f"Completed: {self.operation} in {duration:.4f}s")
@@ -145,7 +194,6 @@ if __name__ == "__main__":
     
     # Test performance logger
     with PerformanceLogger(logger, "Test operation"):
-        import time
         time.sleep(0.1)
     
     print("Logger test complete")
@@ -4,9 +4,21 @@ Provides comprehensive parameter validation with helpful error messages.
 """
 # Version: 2026-01-11 11:15
 
+import functools
+import hashlib
+import math
+import operator
+import threading
+import weakref
+from collections import OrderedDict
+
 import numpy as np
-import pandas as pd
-from typing import Union, Optional
+from typing import TYPE_CHECKING, Union, Optional
+
+# pandas is only named in annotations and scipy.linalg only used by the
+# covariance checks; neither is imported at module load
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class ValidationError(ValueError):
@@ -98,11 +110,23 @@ def validate_option_params(
     -------
     ValidationError : If any parameter is invalid
     """
-    validate_positive(S0, "Stock price (S0)")
-    validate_positive(K, "Strike price (K)")
-    validate_non_negative(r, "Risk-free rate (r)")
-    validate_positive(sigma, "Volatility (sigma)")
-    validate_positive(T, "Time to maturity (T)")
+    # Fast path: all eight checks as one short-circuit comparison chain;
+    # the flat checks below only run to pick the error message
+    if 0 < S0 and 0 < K and 0 <= r <= 1.0 and 0 < sigma <= 5.0 and 0 < T <= 30.0:
+        return
+    
+    # Same checks and messages as validate_positive / validate_non_negative,
+    # inlined to avoid a call frame per parameter
+    if S0 <= 0:
+        raise ValidationError(f"Stock price (S0) must be positive, got {S0}")
+    if K <= 0:
+        raise ValidationError(f"Strike price (K) must be positive, got {K}")
+    if r < 0:
+        raise ValidationError(f"Risk-free rate (r) must be non-negative, got {r}")
+    if sigma <= 0:
+        raise ValidationError(f"Volatility (sigma) must be positive, got {sigma}")
+    if T <= 0:
+        raise ValidationError(f"Time to maturity (T) must be positive, got {T}")
     
     # Additional sanity checks
     if sigma > 5.0:
@@ -115,6 +139,38 @@ def validate_option_params(
         raise ValidationError(f"Time to maturity {T} years seems unreasonably long")
 
 
+def validate_option_params_batch(S0, K, r, sigma, T) -> None:
+    """
+    Validate many option parameter sets in one vectorized pass.
+    
+    Applies the same checks as validate_option_params elementwise; inputs
+    are scalars or arrays that broadcast together (e.g. a strike grid).
+    
+    Parameters:
+    -----------
+    S0, K, r, sigma, T : float or np.ndarray
+        Stock prices, strikes, risk-free rates, volatilities and maturities
+    
+    Raises:
+    -------
+    ValidationError : For the first invalid parameter set, with the message
+        validate_option_params would give for it
+    """
+    S0, K, r, sigma, T = np.broadcast_arrays(S0, K, r, sigma, T)
+    
+    bad = ((S0 <= 0) | (K <= 0) | (r < 0) | (sigma <= 0) | (T <= 0)
+           | (sigma > 5.0) | (r > 1.0) | (T > 30.0))
+    if not bad.any():
+        return
+    
+    # Re-run the scalar validator on the first offender for its message
+    idx = tuple(int(i) for i in np.unravel_index(np.argmax(bad), bad.shape))
+    try:
+        validate_option_params(S0[idx], K[idx], r[idx], sigma[idx], T[idx])
+    except ValidationError as e:
+        raise ValidationError(f"Invalid option parameters at index {idx}: {e}") from None
+
+
 def validate_weights(weights: np.ndarray, allow_short: bool = False) -> None:
     """
     Validate portfolio weights.
@@ -130,14 +186,15 @@ def validate_weights(weights: np.ndarray, allow_short: bool = False) -> None:
     -------
     ValidationError : If weights are invalid
     """
-    # Robust check for Pandas-like objects (handle potential multiple pandas imports in memory)
-    if hasattr(weights, 'values'):
-        weights = weights.values
-        if hasattr(weights, 'flatten'):
-            weights = weights.flatten()
-            
-    if not isinstance(weights, np.ndarray):
-        raise ValidationError(f"Weights must be a numpy array or pandas Series, got {type(weights).__name__}")
+    # Zero-copy view of ndarrays and pandas objects; a converted 2-D container
+    # (e.g. a one-column DataFrame) is flattened, a 2-D ndarray is rejected below
+    weights_array = np.asarray(weights)
+    if weights_array is not weights and weights_array.ndim > 1:
+        weights_array = weights_array.ravel()
+    weights = weights_array
+    
+    if weights.dtype.kind not in 'biuf':
+        raise ValidationError(f"Weights must be numeric, got dtype {weights.dtype}")
     
     if weights.ndim != 1:
         raise ValidationError(f"Weights must be 1-dimensional, got shape {weights.shape}")
@@ -145,30 +202,129 @@ def validate_weights(weights: np.ndarray, allow_short: bool = False) -> None:
     if len(weights) == 0:
         raise ValidationError("Weights array is empty")
     
-    # Check sum to 1
-    weight_sum = np.sum(weights)
-    if not np.isclose(weight_sum, 1.0, atol=1e-4):
-        raise ValidationError(f"Weights must sum to 1, got {weight_sum}")
+    # NaN and inf propagate into the sum, so one reduction covers both the
+    # finiteness and the sum-to-1 checks
+    weight_sum = float(weights.sum())
+    
+    # Check for NaN or inf
+    if not math.isfinite(weight_sum):
+        raise ValidationError("Weights contain NaN or inf values")
+    
+    # Check sum to 1 (np.isclose tolerances: atol=1e-4, rtol=1e-5)
+    if abs(weight_sum - 1.0) > 1e-4 + 1e-5:
+        # Exact sum only for the message
+        raise ValidationError(f"Weights must sum to 1, got {math.fsum(weights)}")
     
     # Check for short positions if not allowed
-    if not allow_short and np.any(weights < -1e-6):
+    if not allow_short and weights.min() < -1e-6:
         raise ValidationError(f"Negative weights not allowed: {weights[weights < 0]}")
+
+
+def validate_weights_batch(weights_matrix: np.ndarray, allow_short: bool = False) -> None:
+    """
+    Validate a batch of portfolio weight vectors in a single vectorized pass.
+
+    Parameters:
+    -----------
+    weights_matrix : np.ndarray
+        Matrix of shape (n_portfolios, n_assets), one weight vector per row
+    allow_short : bool
+        Whether short positions are allowed
+
+    Raises:
+    -------
+    ValidationError : On the first row holding invalid weights
+    """
+    weights_matrix = np.asarray(weights_matrix, dtype=float)
+
+    if weights_matrix.ndim != 2:
+        raise ValidationError(f"Weights batch must be 2-dimensional, got shape {weights_matrix.shape}")
+
+    if weights_matrix.size == 0:
+        raise ValidationError("Weights batch is empty")
+
+    # One per-row mask over all checks, so the first invalid row is reported
+    # whichever check it fails; NaN and inf propagate into the row sums
+    row_sums = weights_matrix.sum(axis=1)
+    nan_rows = ~np.isfinite(row_sums)
+    # Same tolerance as validate_weights (np.isclose: atol=1e-4, rtol=1e-5)
+    sum_rows = np.abs(row_sums - 1.0) > 1e-4 + 1e-5
+    bad_rows = nan_rows | sum_rows
+    if not allow_short:
+        neg_rows = weights_matrix.min(axis=1) < -1e-6
+        bad_rows |= neg_rows
+    if not bad_rows.any():
+        return
+
+    # Report the row's first failing check, in validate_weights' order
+    row = int(np.argmax(bad_rows))
+    weights = weights_matrix[row]
+    if nan_rows[row]:
+        raise ValidationError(f"Weights in row {row} contain NaN or inf values")
+    if sum_rows[row]:
+        raise ValidationError(f"Weights in row {row} must sum to 1, got {math.fsum(weights)}")
+    raise ValidationError(f"Negative weights not allowed in row {row}: "
+                          f"{weights[weights < 0]}")
+
+
+# LRU cache of covariance matrices that passed validate_covariance_matrix_v3,
+# keyed by shape, dtype and a content digest
+_COV_CACHE_SIZE = 128
+_cov_validation_cache = OrderedDict()
+_cov_validation_lock = threading.Lock()
+
+# Read-only arrays (owning their data) that passed validation, by id(), for callers
+# opting in with skip_if_seen=True; entries vanish when the array is freed, so a
+# reused id() can never match a different matrix
+_validated_readonly_covs = weakref.WeakValueDictionary()
+
+
+def _cov_cache_key(cov_matrix: np.ndarray) -> Optional[tuple]:
+    """
+    Cache key (shape, dtype, 128-bit BLAKE2b digest of the contents).
     
-    # Check for NaN or inf
-    if np.any(~np.isfinite(weights)):
-        raise ValidationError("Weights contain NaN or inf values")
+    Returns None for non-numeric dtypes, which are never cached.
+    """
+    if cov_matrix.dtype.kind not in 'fiu':
+        return None
+    digest = hashlib.blake2b(np.ascontiguousarray(cov_matrix), digest_size=16).digest()
+    return cov_matrix.shape, cov_matrix.dtype.str, digest
 
 
-def validate_covariance_matrix_v3(cov_matrix):
+def _is_symmetric(cov_matrix: np.ndarray) -> bool:
+    """
+    Symmetry test with np.allclose(cov, cov.T, atol=1e-8) tolerances.
+    
+    Compares only the strict upper triangle against its mirror, so half the
+    elements are touched and no n x n temporaries are built.
+    """
+    iu = np.triu_indices(cov_matrix.shape[0], k=1)
+    upper = cov_matrix[iu]
+    lower = cov_matrix.T[iu]
+    return bool(np.all(np.abs(upper - lower) <= 1e-8 + 1e-5 * np.abs(lower)))
+
+
+def validate_covariance_matrix_v3(cov_matrix, skip_if_seen: bool = False):
     """
     Validate covariance matrix and return as numpy array.
+    
+    With skip_if_seen=True, a read-only array owning its data that already
+    passed is accepted without any check. The caller vouches that it has not
+    been modified since (setflags(write=True) would allow that).
     """
-    # Robust check for Pandas-like objects
-    if hasattr(cov_matrix, 'values') and not isinstance(cov_matrix, np.ndarray):
-        cov_matrix = cov_matrix.values
-        
-    if not isinstance(cov_matrix, np.ndarray):
-        raise ValidationError(f"Covariance matrix must be a numpy array (v3), got {type(cov_matrix).__name__}")
+    # Zero-copy view of ndarrays and pandas DataFrames
+    cov_matrix = np.asarray(cov_matrix)
+    
+    # Only owning arrays are remembered: a read-only view could be written
+    # through its base
+    frozen = cov_matrix.flags.owndata and not cov_matrix.flags.writeable
+    if frozen and skip_if_seen:
+        with _cov_validation_lock:
+            if _validated_readonly_covs.get(id(cov_matrix)) is cov_matrix:
+                return
+    
+    if cov_matrix.dtype.kind not in 'biuf':
+        raise ValidationError(f"Covariance matrix must be numeric, got dtype {cov_matrix.dtype}")
     
     if cov_matrix.ndim != 2:
         raise ValidationError(f"Covariance matrix must be 2D, got shape {cov_matrix.shape}")
@@ -177,26 +333,91 @@ def validate_covariance_matrix_v3(cov_matrix):
     if n != m:
         raise ValidationError(f"Covariance matrix must be square, got {n}x{m}")
     
+    if n == 0:
+        raise ValidationError("Covariance matrix is empty")
+    
+    # O(n) quick reject on the diagonal before any O(n²) scan or O(n³)
+    # factorization: variances must be finite and positive
+    variances = np.diagonal(cov_matrix)
+    if not np.isfinite(variances).all():
+        raise ValidationError("Covariance matrix contains NaN or inf values")
+    if variances.min() <= 0:
+        raise ValidationError("Covariance matrix diagonal (variances) must be positive")
+    
+    # Repeated validation of an identical matrix (rebalancing sweeps,
+    # scenario fans) is answered from the cache
+    key = _cov_cache_key(cov_matrix)
+    if key is not None:
+        with _cov_validation_lock:
+            if key in _cov_validation_cache:
+                _cov_validation_cache.move_to_end(key)
+                return
+    
     # Check symmetry
-    if not np.allclose(cov_matrix, cov_matrix.T, atol=1e-8):
+    if not _is_symmetric(cov_matrix):
         raise ValidationError("Covariance matrix must be symmetric")
     
-    # Check positive semi-definite
-    eigenvalues = np.linalg.eigvalsh(cov_matrix)
-    if np.any(eigenvalues < -1e-8):
-        raise ValidationError(f"Covariance matrix must be positive semi-definite, "
-                            f"got negative eigenvalue: {eigenvalues.min()}")
-    
-    # Check for NaN or inf
-    if np.any(~np.isfinite(cov_matrix)):
+    # Check for NaN or inf (before factorizing, so LAPACK can skip its own scan)
+    if not np.isfinite(cov_matrix).all():
         raise ValidationError("Covariance matrix contains NaN or inf values")
     
-    # Check diagonal (variances) are positive
-    if np.any(np.diag(cov_matrix) <= 0):
-        raise ValidationError("Covariance matrix diagonal (variances) must be positive")
+    # Check positive semi-definite: a successful Cholesky proves positive
+    # definiteness; only singular or indefinite matrices pay for the
+    # eigendecomposition
+    from scipy.linalg import cholesky, eigh
+    try:
+        cholesky(cov_matrix, lower=True, check_finite=False)
+    except np.linalg.LinAlgError:
+        # Only the smallest eigenvalue matters (LAPACK ?syevr subset)
+        min_eigenvalue = eigh(cov_matrix, eigvals_only=True, subset_by_index=[0, 0],
+                              driver='evr', check_finite=False)[0]
+        if min_eigenvalue < -1e-8:
+            raise ValidationError(f"Covariance matrix must be positive semi-definite, "
+                                f"got negative eigenvalue: {min_eigenvalue}")
+    
+    with _cov_validation_lock:
+        if key is not None:
+            _cov_validation_cache[key] = True
+            if len(_cov_validation_cache) > _COV_CACHE_SIZE:
+                _cov_validation_cache.popitem(last=False)
+        if frozen:
+            _validated_readonly_covs[id(cov_matrix)] = cov_matrix
 
 
-def validate_returns(returns: Union[np.ndarray, pd.Series]) -> None:
+def validate_covariance_matrix(cov_matrix: np.ndarray, trusted: bool = False,
+                               skip_if_seen: bool = False) -> None:
+    """
+    Validate covariance matrix.
+
+    Parameters:
+    -----------
+    cov_matrix : np.ndarray or pd.DataFrame
+        Covariance matrix
+    trusted : bool
+        If True, only check shape and symmetry. Use for matrices built as
+        outer(vols, vols) * corr from a valid correlation matrix, which are
+        positive semi-definite by construction.
+    skip_if_seen : bool
+        If True, accept a read-only array that already passed full validation
+        without re-checking it. Only for matrices the caller does not modify.
+
+    Raises:
+    -------
+    ValidationError : If covariance matrix is invalid
+    """
+    if not trusted:
+        validate_covariance_matrix_v3(cov_matrix, skip_if_seen=skip_if_seen)
+        return
+
+    cov_matrix = np.asarray(cov_matrix)
+    if cov_matrix.ndim != 2 or cov_matrix.shape[0] != cov_matrix.shape[1]:
+        raise ValidationError(f"Covariance matrix must be square, got shape {cov_matrix.shape}")
+
+    if not _is_symmetric(cov_matrix):
+        raise ValidationError("Covariance matrix must be symmetric")
+
+
+def validate_returns(returns: Union[np.ndarray, "pd.Series"]) -> None:
     """
     Validate returns data.
     
@@ -209,27 +430,37 @@ def validate_returns(returns: Union[np.ndarray, pd.Series]) -> None:
     -------
     ValidationError : If returns are invalid
     """
-    if hasattr(returns, 'values'):
-        returns_array = returns.values
-    elif isinstance(returns, np.ndarray):
-        returns_array = returns
-    else:
-        raise ValidationError(f"Returns must be numpy array or pandas Series, got {type(returns).__name__}")
-    
-    if len(returns_array) == 0:
+    # Same object for ndarrays, zero-copy view for pandas objects
+    returns_array = np.asarray(returns)
+    
+    if returns_array.dtype.kind not in 'biuf' or returns_array.ndim == 0:
+        raise ValidationError(f"Returns must be a numeric array or pandas Series, "
+                              f"got dtype {returns_array.dtype} with shape {returns_array.shape}")
+    
+    if returns_array.size == 0:
         raise ValidationError("Returns array is empty")
     
-    # Check for NaN or inf
-    if np.any(~np.isfinite(returns_array)):
-        nan_count = np.sum(np.isnan(returns_array))
-        inf_count = np.sum(np.isinf(returns_array))
-        raise ValidationError(f"Returns contain {nan_count} NaN and {inf_count} inf values")
-    
-    # Sanity check: returns shouldn't be too extreme
-    if np.any(np.abs(returns_array) > 1.0):
-        extreme_count = np.sum(np.abs(returns_array) > 1.0)
+    # Fast path: min/max are temporary-free reductions and NaN propagates
+    # through them, so in-range bounds prove every value is finite and
+    # within ±100%. Counts are only computed for the error messages.
+    lo, hi = returns_array.min(), returns_array.max()
+    if -1.0 <= lo and hi <= 1.0:
+        return
+    
+    # Error path only: keep FP status checks out of the diagnostic scans
+    with np.errstate(all='ignore'):
+        # Check for NaN or inf
+        if not np.isfinite(returns_array).all():
+            nan_count = np.sum(np.isnan(returns_array))
+            inf_count = np.sum(np.isinf(returns_array))
+            raise ValidationError(f"Returns contain {nan_count} NaN and {inf_count} inf values")
+        
+        # Sanity check: returns shouldn't be too extreme. All values are finite
+        # here, so the bounds above failed on range and already give max |r|
+        extreme_count = (np.count_nonzero(returns_array > 1.0)
+                         + np.count_nonzero(returns_array < -1.0))
         raise ValidationError(f"Returns contain {extreme_count} values > 100% "
-                            f"(max: {np.max(np.abs(returns_array))*100:.1f}%)")
+                              f"(max: {max(hi, -lo)*100:.1f}%)")
 
 
 def validate_monte_carlo_params(n_paths: int, n_steps: int) -> None:
@@ -247,11 +478,16 @@ def validate_monte_carlo_params(n_paths: int, n_steps: int) -> None:
     -------
     ValidationError : If parameters are invalid
     """
-    if not isinstance(n_paths, int):
-        raise ValidationError(f"n_paths must be an integer, got {type(n_paths)}")
+    # operator.index accepts Python and NumPy integers and rejects floats
+    try:
+        n_paths = operator.index(n_paths)
+    except TypeError:
+        raise ValidationError(f"n_paths must be an integer, got {type(n_paths)}") from None
     
-    if not isinstance(n_steps, int):
-        raise ValidationError(f"n_steps must be an integer, got {type(n_steps)}")
+    try:
+        n_steps = operator.index(n_steps)
+    except TypeError:
+        raise ValidationError(f"n_steps must be an integer, got {type(n_steps)}") from None
     
     if n_paths < 100:
         raise ValidationError(f"n_paths should be at least 100 for reasonable accuracy, got {n_paths}")
@@ -267,10 +503,75 @@ def validate_monte_carlo_params(n_paths: int, n_steps: int) -> None:
 
 
 # Decorator for automatic validation
+def _specialize_wrapper(func, sig, validators):
+    """
+    Generate a wrapper with func's own parameter list that calls each
+    validator inline, so a call needs no sig.bind and no dict lookups.
+    
+    Returns None when the signature cannot be rendered safely (a parameter
+    name clashes with the generated helper names).
+    """
+    import inspect
+    
+    if any(name.startswith('_vi_') for name in sig.parameters):
+        return None
+    
+    namespace = {'_vi_func': func, '_vi_error': ValidationError, '_vi_name': func.__name__}
+    kinds = [param.kind for param in sig.parameters.values()]
+    n_pos_only = kinds.count(inspect.Parameter.POSITIONAL_ONLY)
+    
+    params, call = [], []
+    star_seen = False
+    for i, (name, param) in enumerate(sig.parameters.items()):
+        text = name
+        if param.default is not inspect.Parameter.empty:
+            namespace[f'_vi_default_{name}'] = param.default
+            text += f'=_vi_default_{name}'
+        
+        if param.kind is inspect.Parameter.POSITIONAL_ONLY:
+            params.append(text)
+            call.append(name)
+            if i == n_pos_only - 1:
+                params.append('/')
+        elif param.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD:
+            params.append(text)
+            call.append(name)
+        elif param.kind is inspect.Parameter.VAR_POSITIONAL:
+            params.append(f'*{name}')
+            call.append(f'*{name}')
+            star_seen = True
+        elif param.kind is inspect.Parameter.KEYWORD_ONLY:
+            if not star_seen:
+                params.append('*')
+                star_seen = True
+            params.append(text)
+            call.append(f'{name}={name}')
+        else:  # VAR_KEYWORD
+            params.append(f'**{name}')
+            call.append(f'**{name}')
+    
+    lines = [f"def wrapper({', '.join(params)}):"]
+    checks = [(name, v) for name, v in validators.items() if name in sig.parameters]
+    if checks:
+        lines.append("    try:")
+        for i, (name, validator) in enumerate(checks):
+            namespace[f'_vi_v{i}'] = validator
+            lines.append(f"        _vi_v{i}({name}, {name!r})")
+        lines.append("    except _vi_error as _vi_exc:")
+        lines.append("        raise _vi_error(f'In {_vi_name}(): {_vi_exc}')")
+    lines.append(f"    return _vi_func({', '.join(call)})")
+    
+    exec('\n'.join(lines), namespace)
+    return functools.wraps(func)(namespace['wrapper'])
+
+
 def validate_inputs(**validators):
     """
     Decorator for automatic input validation.
     
+    The wrapper is generated once per decorated function with the same
+    parameter list, so validation costs one direct call per validator.
+    
     Usage:
     ------
     @validate_inputs(S0=validate_positive, K=validate_positive)
@@ -278,19 +579,27 @@ def validate_inputs(**validators):
         ...
     """
     def decorator(func):
+        # Signature lookup is slow and never changes: do it once per function
+        import inspect
+        sig = inspect.signature(func)
+        
+        wrapper = _specialize_wrapper(func, sig, validators)
+        if wrapper is not None:
+            return wrapper
+        
+        validator_items = tuple(validators.items())
+        
+        @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            # Get function signature
-            import inspect
-            sig = inspect.signature(func)
             bound = sig.bind(*args, **kwargs)
             bound.apply_defaults()
+            arguments = bound.arguments
             
             # Validate each parameter
-            for param_name, validator in validators.items():
-                if param_name in bound.arguments:
-                    value = bound.arguments[param_name]
+            for param_name, validator in validator_items:
+                if param_name in arguments:
                     try:
-                        validator(value, param_name)
+                        validator(arguments[param_name], param_name)
                     except ValidationError as e:
                         raise ValidationError(f"In {func.__name__}(): {e}")
             